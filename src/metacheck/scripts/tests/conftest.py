@@ -0,0 +1,27 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def empty_w007_result():
+    """No-warning w007 result for an empty SoMEF payload, computed once per session"""
+    from metacheck.scripts.warnings.w007 import detect_empty_identifier_warning
+
+    return detect_empty_identifier_warning({}, "test.json")
+
+
+@pytest.fixture(scope="session")
+def empty_w008_result():
+    """No-warning w008 result for an empty SoMEF payload, computed once per session"""
+    from metacheck.scripts.warnings.w008 import detect_author_name_list_warning
+
+    return detect_author_name_list_warning({}, "test.json")
+
+
+@pytest.fixture
+def pin_w008_metadata_file(monkeypatch):
+    """Return a setter that pins w008's metadata filename lookup to one value for the current test"""
+    def _pin(metadata_file):
+        monkeypatch.setattr("metacheck.scripts.warnings.w008.extract_metadata_source_filename",
+                            lambda *args, **kwargs: metadata_file)
+
+    return _pin
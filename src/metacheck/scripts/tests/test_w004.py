@@ -1,270 +1,169 @@
 import pytest
+from collections import Counter
 from metacheck.scripts.warnings.w004 import detect_programming_language_no_version_pitfall
 
 
+_SRC = "repository/codemeta.json"
+_TECH = "code_parser"
+
+
+def _mk_entry(name, version, source=_SRC, technique=_TECH):
+    """Build a SoMEF programming_languages entry"""
+    return {
+        "source": source,
+        "technique": technique,
+        "result": {"name": name, "version": version}
+    }
+
+
+_LANGUAGES = (
+    "Python", "JavaScript", "Java", "C++", "C", "Go",
+    "Rust", "Ruby", "PHP", "Swift", "Kotlin", "R"
+)
+
+_SCENARIOS = [
+    # No programming_languages key
+    ({}, "test_repo.json", False, []),
+
+    # programming_languages not a list
+    ({"programming_languages": "Python"}, "test_repo.json", False, []),
+
+    # Empty programming_languages list
+    ({"programming_languages": []}, "test_repo.json", False, []),
+
+    # Language with version (no warning)
+    (
+            {"programming_languages": [_mk_entry("Python", "3.9")]},
+            "test_repo.json",
+            False,
+            []
+    ),
+
+    # Language without version (warning)
+    (
+            {"programming_languages": [_mk_entry("Python", None)]},
+            "test_repo.json",
+            True,
+            ["Python"]
+    ),
+
+    # Multiple languages, all with versions (no warning)
+    (
+            {"programming_languages": [_mk_entry("Python", "3.9"), _mk_entry("JavaScript", "ES6")]},
+            "test_repo.json",
+            False,
+            []
+    ),
+
+    # Multiple languages, some without versions (warning)
+    (
+            {
+                "programming_languages": [
+                    _mk_entry("Python", "3.9"),
+                    _mk_entry("JavaScript", None),
+                    _mk_entry("Java", None)
+                ]
+            },
+            "test_repo.json",
+            True,
+            ["JavaScript", "Java"]
+    ),
+
+    # All languages without versions (warning)
+    (
+            {"programming_languages": [_mk_entry("Python", None), _mk_entry("R", None)]},
+            "test_repo.json",
+            True,
+            ["Python", "R"]
+    ),
+
+    # Language without name field
+    (
+            {
+                "programming_languages": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser",
+                    "result": {
+                        "version": None
+                    }
+                }]
+            },
+            "test_repo.json",
+            True,
+            ["Unknown"]
+    ),
+
+    # Non-codemeta source (should not detect)
+    (
+            {"programming_languages": [_mk_entry("Python", None, source="README.md", technique="header_analysis")]},
+            "test_repo.json",
+            False,
+            []
+    ),
+
+    # Wrong technique (should not detect)
+    (
+            {"programming_languages": [_mk_entry("Python", None, technique="file_exploration")]},
+            "test_repo.json",
+            False,
+            []
+    ),
+
+    # Mixed sources, only codemeta detected
+    (
+            {
+                "programming_languages": [
+                    _mk_entry("Python", None, source="README.md", technique="header_analysis"),
+                    _mk_entry("JavaScript", None)
+                ]
+            },
+            "test_repo.json",
+            True,
+            ["JavaScript"]
+    ),
+
+    # Version field exists but is explicitly None
+    (
+            {"programming_languages": [_mk_entry("C++", None)]},
+            "test_repo.json",
+            True,
+            ["C++"]
+    ),
+
+    # Version field missing entirely (treated as None)
+    (
+            {
+                "programming_languages": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser",
+                    "result": {
+                        "name": "Ruby"
+                    }
+                }]
+            },
+            "test_repo.json",
+            True,
+            ["Ruby"]
+    ),
+]
+
+_SCENARIO_IDS = [
+    "empty", "non-list", "empty-list", "py-with-ver", "py-no-ver", "multi-all-ver", "multi-some-no-ver",
+    "all-no-ver", "no-name", "non-codemeta", "wrong-technique", "mixed-sources", "explicit-none", "missing-ver",
+]
+
+@pytest.fixture(scope="module")
+def empty_result():
+    return detect_programming_language_no_version_pitfall({}, "test.json")
+
+
+@pytest.mark.xdist_group(name="w004")
 class TestDetectProgrammingLanguageNoVersionPitfall:
     """Test suite for detect_programming_language_no_version_pitfall function"""
 
-    @pytest.mark.parametrize("somef_data,file_name,expected_has_warning,expected_languages", [
-        # No programming_languages key
-        (
-                {},
-                "test_repo.json",
-                False,
-                []
-        ),
-
-        # programming_languages not a list
-        (
-                {"programming_languages": "Python"},
-                "test_repo.json",
-                False,
-                []
-        ),
-
-        # Empty programming_languages list
-        (
-                {"programming_languages": []},
-                "test_repo.json",
-                False,
-                []
-        ),
-
-        # Language with version (no warning)
-        (
-                {
-                    "programming_languages": [{
-                        "source": "repository/codemeta.json",
-                        "technique": "code_parser",
-                        "result": {
-                            "name": "Python",
-                            "version": "3.9"
-                        }
-                    }]
-                },
-                "test_repo.json",
-                False,
-                []
-        ),
-
-        # Language without version (warning)
-        (
-                {
-                    "programming_languages": [{
-                        "source": "repository/codemeta.json",
-                        "technique": "code_parser",
-                        "result": {
-                            "name": "Python",
-                            "version": None
-                        }
-                    }]
-                },
-                "test_repo.json",
-                True,
-                ["Python"]
-        ),
-
-        # Multiple languages, all with versions (no warning)
-        (
-                {
-                    "programming_languages": [
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {
-                                "name": "Python",
-                                "version": "3.9"
-                            }
-                        },
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {
-                                "name": "JavaScript",
-                                "version": "ES6"
-                            }
-                        }
-                    ]
-                },
-                "test_repo.json",
-                False,
-                []
-        ),
-
-        # Multiple languages, some without versions (warning)
-        (
-                {
-                    "programming_languages": [
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {
-                                "name": "Python",
-                                "version": "3.9"
-                            }
-                        },
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {
-                                "name": "JavaScript",
-                                "version": None
-                            }
-                        },
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {
-                                "name": "Java",
-                                "version": None
-                            }
-                        }
-                    ]
-                },
-                "test_repo.json",
-                True,
-                ["JavaScript", "Java"]
-        ),
-
-        # All languages without versions (warning)
-        (
-                {
-                    "programming_languages": [
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {
-                                "name": "Python",
-                                "version": None
-                            }
-                        },
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {
-                                "name": "R",
-                                "version": None
-                            }
-                        }
-                    ]
-                },
-                "test_repo.json",
-                True,
-                ["Python", "R"]
-        ),
-
-        # Language without name field
-        (
-                {
-                    "programming_languages": [{
-                        "source": "repository/codemeta.json",
-                        "technique": "code_parser",
-                        "result": {
-                            "version": None
-                        }
-                    }]
-                },
-                "test_repo.json",
-                True,
-                ["Unknown"]
-        ),
-
-        # Non-codemeta source (should not detect)
-        (
-                {
-                    "programming_languages": [{
-                        "source": "README.md",
-                        "technique": "header_analysis",
-                        "result": {
-                            "name": "Python",
-                            "version": None
-                        }
-                    }]
-                },
-                "test_repo.json",
-                False,
-                []
-        ),
-
-        # Wrong technique (should not detect)
-        (
-                {
-                    "programming_languages": [{
-                        "source": "repository/codemeta.json",
-                        "technique": "file_exploration",
-                        "result": {
-                            "name": "Python",
-                            "version": None
-                        }
-                    }]
-                },
-                "test_repo.json",
-                False,
-                []
-        ),
-
-        # Mixed sources, only codemeta detected
-        (
-                {
-                    "programming_languages": [
-                        {
-                            "source": "README.md",
-                            "technique": "header_analysis",
-                            "result": {
-                                "name": "Python",
-                                "version": None
-                            }
-                        },
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {
-                                "name": "JavaScript",
-                                "version": None
-                            }
-                        }
-                    ]
-                },
-                "test_repo.json",
-                True,
-                ["JavaScript"]
-        ),
-
-        # Version field exists but is explicitly None
-        (
-                {
-                    "programming_languages": [{
-                        "source": "repository/codemeta.json",
-                        "technique": "code_parser",
-                        "result": {
-                            "name": "C++",
-                            "version": None
-                        }
-                    }]
-                },
-                "test_repo.json",
-                True,
-                ["C++"]
-        ),
-
-        # Version field missing entirely (treated as None)
-        (
-                {
-                    "programming_languages": [{
-                        "source": "repository/codemeta.json",
-                        "technique": "code_parser",
-                        "result": {
-                            "name": "Ruby"
-                        }
-                    }]
-                },
-                "test_repo.json",
-                True,
-                ["Ruby"]
-        ),
-    ])
-    def test_detect_warning_scenarios(self, somef_data, file_name,
-                                      expected_has_warning, expected_languages):
+    @pytest.mark.parametrize(
+        "somef_data,file_name,expected_has_warning,expected_languages", _SCENARIOS, ids=_SCENARIO_IDS)
+    def test_detect_warning_scenarios(self, somef_data, file_name, expected_has_warning, expected_languages):
         """Test various programming language version warning scenarios"""
         result = detect_programming_language_no_version_pitfall(somef_data, file_name)
 
@@ -276,121 +175,64 @@ class TestDetectProgrammingLanguageNoVersionPitfall:
             assert result["source"] is not None
             assert len(result["programming_languages_without_version"]) > 0
 
-    def test_result_structure(self):
+    def test_result_structure(self, empty_result):
         """Test that result always has the expected structure"""
-        somef_data = {}
-        result = detect_programming_language_no_version_pitfall(somef_data, "test.json")
+        assert "has_warning" in empty_result
+        assert "file_name" in empty_result
+        assert "programming_languages_without_version" in empty_result
+        assert "source" in empty_result
 
-        assert "has_warning" in result
-        assert "file_name" in result
-        assert "programming_languages_without_version" in result
-        assert "source" in result
-
-    @pytest.mark.parametrize("language_name", [
-        "Python", "JavaScript", "Java", "C++", "C", "Go",
-        "Rust", "Ruby", "PHP", "Swift", "Kotlin", "R"
-    ])
-    def test_different_programming_languages(self, language_name):
+    def test_all_languages_detected_in_single_call(self):
         """Test detection works for various programming languages"""
-        somef_data = {
-            "programming_languages": [{
-                "source": "repository/codemeta.json",
-                "technique": "code_parser",
-                "result": {
-                    "name": language_name,
-                    "version": None
-                }
-            }]
-        }
+        somef_data = {"programming_languages": [_mk_entry(name, None) for name in _LANGUAGES]}
 
         result = detect_programming_language_no_version_pitfall(somef_data, "test.json")
         assert result["has_warning"] == True
-        assert language_name in result["programming_languages_without_version"]
+        languages = frozenset(result["programming_languages_without_version"])
+        for language_name in _LANGUAGES:
+            assert language_name in languages, language_name
 
     def test_accumulates_multiple_languages_without_version(self):
         """Test that all languages without versions are accumulated"""
-        somef_data = {
-            "programming_languages": [
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "Python", "version": None}
-                },
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "JavaScript", "version": None}
-                },
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "C++", "version": None}
-                }
-            ]
-        }
+        somef_data = {"programming_languages": [_mk_entry(name, None) for name in ("Python", "JavaScript", "C++")]}
 
         result = detect_programming_language_no_version_pitfall(somef_data, "test.json")
         assert result["has_warning"] == True
+        languages = frozenset(result["programming_languages_without_version"])
         assert len(result["programming_languages_without_version"]) == 3
-        assert "Python" in result["programming_languages_without_version"]
-        assert "JavaScript" in result["programming_languages_without_version"]
-        assert "C++" in result["programming_languages_without_version"]
+        assert "Python" in languages
+        assert "JavaScript" in languages
+        assert "C++" in languages
 
     def test_only_counts_null_versions_not_with_versions(self):
         """Test that only null versions are counted, not languages with versions"""
         somef_data = {
             "programming_languages": [
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "Python", "version": "3.9"}
-                },
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "JavaScript", "version": None}
-                },
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "Java", "version": "11"}
-                }
+                _mk_entry(name, version) for name, version in (("Python", "3.9"), ("JavaScript", None), ("Java", "11"))
             ]
         }
 
         result = detect_programming_language_no_version_pitfall(somef_data, "test.json")
         assert result["has_warning"] == True
+        languages = frozenset(result["programming_languages_without_version"])
         assert len(result["programming_languages_without_version"]) == 1
-        assert "JavaScript" in result["programming_languages_without_version"]
-        assert "Python" not in result["programming_languages_without_version"]
-        assert "Java" not in result["programming_languages_without_version"]
+        assert "JavaScript" in languages
+        assert "Python" not in languages
+        assert "Java" not in languages
 
     def test_source_is_set_from_last_entry(self):
         """Test that source is set from entries (last one wins)"""
-        somef_data = {
-            "programming_languages": [
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "Python", "version": None}
-                },
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "JavaScript", "version": None}
-                }
-            ]
-        }
+        somef_data = {"programming_languages": [_mk_entry(name, None) for name in ("Python", "JavaScript")]}
 
         result = detect_programming_language_no_version_pitfall(somef_data, "test.json")
-        assert result["source"] == "repository/codemeta.json"
+        assert result["source"] == _SRC
 
     def test_handles_missing_result_field(self):
         """Test handling when result field is missing"""
         somef_data = {
             "programming_languages": [{
-                "source": "repository/codemeta.json",
-                "technique": "code_parser"
+                "source": _SRC,
+                "technique": _TECH
                 # No result field
             }]
         }
@@ -402,16 +244,7 @@ class TestDetectProgrammingLanguageNoVersionPitfall:
     def test_version_empty_string_not_treated_as_null(self):
         """Test that empty string version is not treated the same as None"""
         # Note: Current implementation only checks for None, not empty string
-        somef_data = {
-            "programming_languages": [{
-                "source": "repository/codemeta.json",
-                "technique": "code_parser",
-                "result": {
-                    "name": "Python",
-                    "version": ""  # Empty string, not None
-                }
-            }]
-        }
+        somef_data = {"programming_languages": [_mk_entry("Python", "")]}  # Empty string, not None
 
         result = detect_programming_language_no_version_pitfall(somef_data, "test.json")
         # Empty string is not None, so no warning
@@ -419,41 +252,20 @@ class TestDetectProgrammingLanguageNoVersionPitfall:
 
     def test_multiple_entries_same_language(self):
         """Test handling of multiple entries for the same language"""
-        somef_data = {
-            "programming_languages": [
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "Python", "version": None}
-                },
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"name": "Python", "version": None}
-                }
-            ]
-        }
+        somef_data = {"programming_languages": [_mk_entry("Python", None) for _ in range(2)]}
 
         result = detect_programming_language_no_version_pitfall(somef_data, "test.json")
         assert result["has_warning"] == True
         # Both entries should be added (no deduplication in current implementation)
-        assert result["programming_languages_without_version"].count("Python") == 2
+        counts = Counter(result["programming_languages_without_version"])
+        assert counts["Python"] == 2
 
     @pytest.mark.parametrize("version_value", [
         "3.9", "2.7.18", "11", "ES6", "C++17", "1.0.0", "latest"
     ])
     def test_various_version_formats(self, version_value):
         """Test that various version formats are recognized as having version"""
-        somef_data = {
-            "programming_languages": [{
-                "source": "repository/codemeta.json",
-                "technique": "code_parser",
-                "result": {
-                    "name": "Language",
-                    "version": version_value
-                }
-            }]
-        }
+        somef_data = {"programming_languages": [_mk_entry("Language", version_value)]}
 
         result = detect_programming_language_no_version_pitfall(somef_data, "test.json")
         assert result["has_warning"] == False
@@ -462,8 +274,8 @@ class TestDetectProgrammingLanguageNoVersionPitfall:
         """Test that 'Unknown' is used when name field is missing"""
         somef_data = {
             "programming_languages": [{
-                "source": "repository/codemeta.json",
-                "technique": "code_parser",
+                "source": _SRC,
+                "technique": _TECH,
                 "result": {
                     "version": None
                     # No name field
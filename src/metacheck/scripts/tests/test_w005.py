@@ -1,46 +1,147 @@
 import pytest
-from unittest.mock import patch
 from metacheck.scripts.warnings.w005 import (
     detect_multiple_requirements_in_string,
     detect_multiple_requirements_string_warning
 )
 
 
-class TestDetectMultipleRequirementsInString:
-    """Test suite for detect_multiple_requirements_in_string function"""
-
-    @pytest.mark.parametrize("requirement_string,expected_count", [
-        # Empty or None
-        ("", 0),
-        (None, 0),
-
-        # Not a string
-        (123, 0),
-        ([], 0),
-
-        # Single requirement
-        ("Python 3.9", 0),
-        ("numpy>=1.20.0", 0),
-        ("A single package", 0),
-
-        # Multiple spaces (separator)
-        ("numpy  pandas", 2),
-        ("package1  package2  package3", 3),
+_REQUIREMENT_STRING_CASES = [
+    # Empty or None
+    ("", 0),
+    (None, 0),
+
+    # Not a string
+    (123, 0),
+    ([], 0),
+
+    # Multiple spaces (separator)
+    ("numpy  pandas", 2),
+    ("package1  package2  package3", 3),
+
+    # Capital letter pattern
+    ("Python NumPy Pandas", 3),
+    ("Java Spring Maven", 3),
+
+    # Whitespace handling
+    ("  numpy  pandas  ", 2),
+
+    # Complex cases
+    ("Python3 NumPy SciPy", 3),
+]
+
+
+_W005_CASES = (
+    # No requirements key
+    pytest.param(
+            {},
+            "test_repo.json",
+            False,
+            0,
+            id="no-requirements-key"
+    ),
+
+    # requirements not a list
+    pytest.param(
+            {"requirements": "numpy pandas"},
+            "test_repo.json",
+            False,
+            0,
+            id="requirements-not-list"
+    ),
+
+    # Empty requirements list
+    pytest.param(
+            {"requirements": []},
+            "test_repo.json",
+            False,
+            0,
+            id="empty-requirements"
+    ),
+
+    # Single requirement (no warning)
+    pytest.param(
+            {
+                "requirements": [{
+                    "technique": "codemeta.json",
+                    "source": "repository/codemeta.json",
+                    "result": {"value": "Python 3.9"}
+                }]
+            },
+            "test_repo.json",
+            False,
+            0,
+            id="single-requirement"
+    ),
+
+    # Multiple requirements in single string (warning)
+    pytest.param(
+            {
+                "requirements": [{
+                    "technique": "codemeta.json",
+                    "source": "repository/codemeta.json",
+                    "result": {"value": "numpy  pandas  scipy"}
+                }]
+            },
+            "test_repo.json",
+            True,
+            3,
+            id="multiple-spaces"
+    ),
+
+    # Multiple requirements with capital letters (warning)
+    pytest.param(
+            {
+                "requirements": [{
+                    "source": "repository/setup.py",
+                    "result": {"value": "Python NumPy Pandas"}
+                }]
+            },
+            "test_repo.json",
+            True,
+            3,
+            id="capitalized-words"
+    ),
+
+    # List with single element containing multiple (warning)
+    pytest.param(
+            {
+                "requirements": [{
+                    "technique": "pom.xml",
+                    "source": "repository/pom.xml",
+                    "result": {"value": ["numpy  pandas"]}
+                }]
+            },
+            "test_repo.json",
+            True,
+            2,
+            id="single-element-list"
+    ),
+
+    # List with multiple elements (no warning - properly structured)
+    pytest.param(
+            {
+                "requirements": [{
+                    "technique": "codemeta.json",
+                    "source": "repository/codemeta.json",
+                    "result": {"value": ["numpy", "pandas"]}
+                }]
+            },
+            "test_repo.json",
+            False,
+            0,
+            id="multi-element-list"
+    ),
+)
 
-        # Capital letter pattern
-        ("Python NumPy Pandas", 3),
-        ("Java Spring Maven", 3),
 
-        # Whitespace handling
-        ("  numpy  pandas  ", 2),
+class TestDetectMultipleRequirementsInString:
+    """Test suite for detect_multiple_requirements_in_string function"""
 
-        # Complex cases
-        ("Python3 NumPy SciPy", 3),
-    ])
-    def test_multiple_requirements_detection(self, requirement_string, expected_count):
+    def test_multiple_requirements_detection(self):
         """Test detection of multiple requirements in string"""
-        result = detect_multiple_requirements_in_string(requirement_string)
-        assert len(result) == expected_count
+        for requirement_string, expected_count in _REQUIREMENT_STRING_CASES:
+            result = detect_multiple_requirements_in_string(requirement_string)
+            assert len(result) == expected_count, requirement_string
 
     def test_returns_empty_list_for_single_requirement(self):
         """Test that single requirements return empty list"""
@@ -48,6 +149,7 @@ class TestDetectMultipleRequirementsInString:
             "Python 3.9",
             "numpy>=1.20.0",
             "django",
+            "A single package",
             "A single package name"
         ]
 
@@ -84,116 +186,30 @@ class TestDetectMultipleRequirementsInString:
             assert req == req.strip()
 
 
+@pytest.mark.xdist_group(name="w005")
 class TestDetectMultipleRequirementsStringWarning:
     """Test suite for detect_multiple_requirements_string_warning function"""
 
-    @pytest.mark.parametrize("somef_data,file_name,expected_has_warning,expected_count", [
-        # No requirements key
-        (
-                {},
-                "test_repo.json",
-                False,
-                0
-        ),
-
-        # requirements not a list
-        (
-                {"requirements": "numpy pandas"},
-                "test_repo.json",
-                False,
-                0
-        ),
-
-        # Empty requirements list
-        (
-                {"requirements": []},
-                "test_repo.json",
-                False,
-                0
-        ),
-
-        # Single requirement (no warning)
-        (
-                {
-                    "requirements": [{
-                        "technique": "codemeta.json",
-                        "source": "repository/codemeta.json",
-                        "result": {"value": "Python 3.9"}
-                    }]
-                },
-                "test_repo.json",
-                False,
-                0
-        ),
+    @pytest.fixture(autouse=True)
+    def _patch_extract(self, monkeypatch):
+        monkeypatch.setattr(
+            "metacheck.scripts.warnings.w005.extract_metadata_source_filename",
+            lambda src="": src.split("/")[-1] if src else ""
+        )
 
-        # Multiple requirements in single string (warning)
-        (
-                {
-                    "requirements": [{
-                        "technique": "codemeta.json",
-                        "source": "repository/codemeta.json",
-                        "result": {"value": "numpy  pandas  scipy"}
-                    }]
-                },
-                "test_repo.json",
-                True,
-                3
-        ),
-
-        # Multiple requirements with capital letters (warning)
-        (
-                {
-                    "requirements": [{
-                        "source": "repository/setup.py",
-                        "result": {"value": "Python NumPy Pandas"}
-                    }]
-                },
-                "test_repo.json",
-                True,
-                3
-        ),
-
-        # List with single element containing multiple (warning)
-        (
-                {
-                    "requirements": [{
-                        "technique": "pom.xml",
-                        "source": "repository/pom.xml",
-                        "result": {"value": ["numpy  pandas"]}
-                    }]
-                },
-                "test_repo.json",
-                True,
-                2
-        ),
-
-        # List with multiple elements (no warning - properly structured)
-        (
-                {
-                    "requirements": [{
-                        "technique": "codemeta.json",
-                        "source": "repository/codemeta.json",
-                        "result": {"value": ["numpy", "pandas"]}
-                    }]
-                },
-                "test_repo.json",
-                False,
-                0
-        ),
-    ])
+    @pytest.mark.parametrize("somef_data,file_name,expected_has_warning,expected_count", _W005_CASES)
     def test_detect_warning_scenarios(self, somef_data, file_name,
                                       expected_has_warning, expected_count):
         """Test various multiple requirements string detection scenarios"""
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value="test_file"):
-            result = detect_multiple_requirements_string_warning(somef_data, file_name)
+        result = detect_multiple_requirements_string_warning(somef_data, file_name)
 
-            assert result["has_warning"] == expected_has_warning
-            assert result["file_name"] == file_name
-            assert result["count_detected"] == expected_count
+        assert result["has_warning"] == expected_has_warning
+        assert result["file_name"] == file_name
+        assert result["count_detected"] == expected_count
 
-            if expected_has_warning:
-                assert result["requirement_string"] is not None
-                assert len(result["detected_requirements"]) == expected_count
+        if expected_has_warning:
+            assert result["requirement_string"] is not None
+            assert len(result["detected_requirements"]) == expected_count
 
     def test_result_structure(self):
         """Test that result always has the expected structure"""
@@ -222,9 +238,8 @@ class TestDetectMultipleRequirementsStringWarning:
             }]
         }
 
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value=source.split('/')[-1]):
-            result = detect_multiple_requirements_string_warning(somef_data, "test.json")
-            assert result["has_warning"] == True
+        result = detect_multiple_requirements_string_warning(somef_data, "test.json")
+        assert result["has_warning"] == True
 
     def test_technique_matching(self):
         """Test that technique field is also used for matching"""
@@ -236,9 +251,8 @@ class TestDetectMultipleRequirementsStringWarning:
             }]
         }
 
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value=""):
-            result = detect_multiple_requirements_string_warning(somef_data, "test.json")
-            assert result["has_warning"] == True
+        result = detect_multiple_requirements_string_warning(somef_data, "test.json")
+        assert result["has_warning"] == True
 
     def test_stops_at_first_warning(self):
         """Test that detection stops at first warning found"""
@@ -257,10 +271,9 @@ class TestDetectMultipleRequirementsStringWarning:
             ]
         }
 
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value="codemeta.json"):
-            result = detect_multiple_requirements_string_warning(somef_data, "test.json")
-            assert result["has_warning"] == True
-            assert "numpy" in result["detected_requirements"]
+        result = detect_multiple_requirements_string_warning(somef_data, "test.json")
+        assert result["has_warning"] == True
+        assert "numpy" in result["detected_requirements"]
 
     def test_source_fallback_to_technique(self):
         """Test that source falls back to technique when source is empty"""
@@ -272,10 +285,9 @@ class TestDetectMultipleRequirementsStringWarning:
             }]
         }
 
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value=""):
-            result = detect_multiple_requirements_string_warning(somef_data, "test.json")
-            assert result["has_warning"] == True
-            assert "technique: setup.py" in result["source"]
+        result = detect_multiple_requirements_string_warning(somef_data, "test.json")
+        assert result["has_warning"] == True
+        assert "technique: setup.py" in result["source"]
 
     def test_non_string_value_types(self):
         """Test handling of non-string value types"""
@@ -288,10 +300,9 @@ class TestDetectMultipleRequirementsStringWarning:
             }]
         }
 
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value="codemeta.json"):
-            result1 = detect_multiple_requirements_string_warning(somef_data1, "test.json")
-            # Dict is not handled as multiple requirements
-            assert result1["has_warning"] == False
+        result1 = detect_multiple_requirements_string_warning(somef_data1, "test.json")
+        # Dict is not handled as multiple requirements
+        assert result1["has_warning"] == False
 
         # Integer value
         somef_data2 = {
@@ -302,9 +313,8 @@ class TestDetectMultipleRequirementsStringWarning:
             }]
         }
 
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value="codemeta.json"):
-            result2 = detect_multiple_requirements_string_warning(somef_data2, "test.json")
-            assert result2["has_warning"] == False
+        result2 = detect_multiple_requirements_string_warning(somef_data2, "test.json")
+        assert result2["has_warning"] == False
 
     def test_list_with_multiple_elements(self):
         """Test that properly structured lists don't trigger warning"""
@@ -316,10 +326,9 @@ class TestDetectMultipleRequirementsStringWarning:
             }]
         }
 
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value="codemeta.json"):
-            result = detect_multiple_requirements_string_warning(somef_data, "test.json")
-            # Multiple elements in list is correct format, no warning
-            assert result["has_warning"] == False
+        result = detect_multiple_requirements_string_warning(somef_data, "test.json")
+        # Multiple elements in list is correct format, no warning
+        assert result["has_warning"] == False
 
     def test_list_with_single_concatenated_element(self):
         """Test that list with single concatenated element triggers warning"""
@@ -331,10 +340,9 @@ class TestDetectMultipleRequirementsStringWarning:
             }]
         }
 
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value="codemeta.json"):
-            result = detect_multiple_requirements_string_warning(somef_data, "test.json")
-            assert result["has_warning"] == True
-            assert result["count_detected"] == 3
+        result = detect_multiple_requirements_string_warning(somef_data, "test.json")
+        assert result["has_warning"] == True
+        assert result["count_detected"] == 3
 
     @pytest.mark.parametrize("req_string,expected_reqs", [
         ("numpy  pandas", ["numpy", "pandas"]),
@@ -351,8 +359,7 @@ class TestDetectMultipleRequirementsStringWarning:
             }]
         }
 
-        with patch('metacheck.scripts.warnings.w005.extract_metadata_source_filename', return_value="codemeta.json"):
-            result = detect_multiple_requirements_string_warning(somef_data, "test.json")
-            assert result["has_warning"] == True
-            for expected_req in expected_reqs:
-                assert expected_req in result["detected_requirements"]
\ No newline at end of file
+        result = detect_multiple_requirements_string_warning(somef_data, "test.json")
+        assert result["has_warning"] == True
+        for expected_req in expected_reqs:
+            assert expected_req in result["detected_requirements"]
\ No newline at end of file
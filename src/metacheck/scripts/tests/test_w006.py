@@ -1,4 +1,5 @@
 import pytest
+from types import MappingProxyType
 from metacheck.scripts.warnings.w006 import (
     is_valid_identifier,
     has_doi_in_other_sources,  # Added this import
@@ -6,44 +7,122 @@ from metacheck.scripts.warnings.w006 import (
 )
 
 
+_IDENTIFIER_CASES = [
+    # Empty or None
+    ("", False),
+    (None, False),
+
+    # Valid DOI patterns
+    ("doi:10.1234/example", True),
+    ("DOI:10.5678/test", True),
+    ("10.1000/journal.12345", True),
+    ("10.5281/zenodo.67890", True),
+
+    # Valid URLs
+    ("https://example.com", True),
+    ("http://example.org/resource", True),
+    ("https://doi.org/10.1234/example", True),
+
+    # Invalid identifiers (names, not IDs)
+    ("Project Name", False),
+    ("My Software", False),
+    ("John Doe", False),
+    ("Software Title", False),
+
+    # Edge cases
+    ("doi:", False),  # doi: without actual DOI
+    ("10.", False),  # Incomplete DOI
+    ("ftp://example.com", False),  # Not http/https
+
+    # Case insensitive
+    ("DOI:10.1234/test", True),
+    ("HTTPS://EXAMPLE.COM", True),
+]
+
+
+_CODEMETA_NAME = {"source": "repository/codemeta.json", "technique": "code_parser", "result": {"value": "Project Name"}}
+
+# Payloads are shared by every parametrized case, so they are exposed read-only
+_W006_CASES = (
+    pytest.param(
+            MappingProxyType({}),
+            "test_repo.json",
+            False,
+            id="no-identifier-key"
+    ),
+    pytest.param(
+            MappingProxyType({"identifier": "Project Name"}),
+            "test_repo.json",
+            False,
+            id="identifier-not-list"
+    ),
+    pytest.param(
+            MappingProxyType({"identifier": []}),
+            "test_repo.json",
+            False,
+            id="empty-identifier-list"
+    ),
+    pytest.param(
+            MappingProxyType({
+                "identifier": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser",
+                    "result": {"value": "10.1234/example"}
+                }]
+            }),
+            "test_repo.json",
+            False,
+            id="valid-codemeta-identifier"
+    ),
+    pytest.param(
+            MappingProxyType({"identifier": [_CODEMETA_NAME]}),
+            "test_repo.json",
+            False,
+            id="name-without-identifier-elsewhere"
+    ),
+    pytest.param(
+            MappingProxyType({
+                "identifier": [
+                    _CODEMETA_NAME,
+                    {"source": "README.md", "result": {"value": "10.1234/example"}}
+                ]
+            }),
+            "test_repo.json",
+            True,
+            id="name-with-doi-elsewhere"
+    ),
+    pytest.param(
+            MappingProxyType({
+                "identifier": [
+                    {"source": "repository/codemeta.json", "technique": "code_parser", "result": {"value": "My Software"}},
+                    {"source": "CITATION.cff", "result": {"value": "https://doi.org/10.1234/test"}}
+                ]
+            }),
+            "test_repo.json",
+            True,
+            id="name-with-url-elsewhere"
+    ),
+    pytest.param(
+            MappingProxyType({
+                "identifier": [
+                    {"source": "repository/CODEMETA.json", "technique": "code_parser", "result": {"value": "Project"}},
+                    {"source": "README.md", "result": {"value": "doi:10.1234/test"}}
+                ]
+            }),
+            "test_repo.json",
+            True,
+            id="uppercase-codemeta-source"
+    ),
+)
+
+
 class TestIsValidIdentifier:
     """Test suite for is_valid_identifier function"""
 
-    @pytest.mark.parametrize("identifier,expected", [
-        # Empty or None
-        ("", False),
-        (None, False),
-
-        # Valid DOI patterns
-        ("doi:10.1234/example", True),
-        ("DOI:10.5678/test", True),
-        ("10.1000/journal.12345", True),
-        ("10.5281/zenodo.67890", True),
-
-        # Valid URLs
-        ("https://example.com", True),
-        ("http://example.org/resource", True),
-        ("https://doi.org/10.1234/example", True),
-
-        # Invalid identifiers (names, not IDs)
-        ("Project Name", False),
-        ("My Software", False),
-        ("John Doe", False),
-        ("Software Title", False),
-
-        # Edge cases
-        ("doi:", False),  # doi: without actual DOI
-        ("10.", False),  # Incomplete DOI
-        ("ftp://example.com", False),  # Not http/https
-
-        # Case insensitive
-        ("DOI:10.1234/test", True),
-        ("HTTPS://EXAMPLE.COM", True),
-    ])
-    def test_identifier_validation(self, identifier, expected):
+    def test_identifier_validation(self):
         """Test identifier validation scenarios"""
-        result = is_valid_identifier(identifier)
-        assert result == expected
+        for identifier, expected in _IDENTIFIER_CASES:
+            assert is_valid_identifier(identifier) == expected, identifier
 
 
 class TestHasDoiInOtherSources:
@@ -73,6 +152,22 @@ class TestHasDoiInOtherSources:
         result = has_doi_in_other_sources(identifier_entries)
         assert result == False
 
+    def test_none_result_is_skipped(self):
+        """Test that entries with a None result are skipped"""
+        identifier_entries = [
+            {
+                "source": "README.md",
+                "result": None
+            },
+            {
+                "source": "README.md",
+                "result": {"value": "10.1234/example"}
+            }
+        ]
+
+        result = has_doi_in_other_sources(identifier_entries)
+        assert result == True
+
     def test_doi_only_in_codemeta(self):
         """Test when DOI only exists in codemeta.json"""
         identifier_entries = [
@@ -113,111 +208,7 @@ class TestHasDoiInOtherSources:
 class TestDetectIdentifierNameWarning:
     """Test suite for detect_identifier_name_warning function"""
 
-    @pytest.mark.parametrize("somef_data,file_name,expected_has_warning", [
-        # No identifier key
-        (
-                {},
-                "test_repo.json",
-                False
-        ),
-
-        # identifier not a list
-        (
-                {"identifier": "Project Name"},
-                "test_repo.json",
-                False
-        ),
-
-        # Empty identifier list
-        (
-                {"identifier": []},
-                "test_repo.json",
-                False
-        ),
-
-        # Valid identifier in codemeta (no warning)
-        (
-                {
-                    "identifier": [{
-                        "source": "repository/codemeta.json",
-                        "technique": "code_parser",
-                        "result": {"value": "10.1234/example"}
-                    }]
-                },
-                "test_repo.json",
-                False
-        ),
-
-        # Name in codemeta, but no valid identifier elsewhere (no warning)
-        (
-                {
-                    "identifier": [{
-                        "source": "repository/codemeta.json",
-                        "technique": "code_parser",
-                        "result": {"value": "Project Name"}
-                    }]
-                },
-                "test_repo.json",
-                False
-        ),
-
-        # Name in codemeta, valid DOI elsewhere (warning)
-        (
-                {
-                    "identifier": [
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": "Project Name"}
-                        },
-                        {
-                            "source": "README.md",
-                            "result": {"value": "10.1234/example"}
-                        }
-                    ]
-                },
-                "test_repo.json",
-                True
-        ),
-
-        # Name in codemeta, valid URL elsewhere (warning)
-        (
-                {
-                    "identifier": [
-                        {
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": "My Software"}
-                        },
-                        {
-                            "source": "CITATION.cff",
-                            "result": {"value": "https://doi.org/10.1234/test"}
-                        }
-                    ]
-                },
-                "test_repo.json",
-                True
-        ),
-
-        # Name in codemeta with lowercase source match (warning)
-        (
-                {
-                    "identifier": [
-                        {
-                            "source": "repository/CODEMETA.json",
-                            "technique": "code_parser",
-                            "result": {"value": "Project"}
-                        },
-                        {
-                            "source": "README.md",
-                            "result": {"value": "doi:10.1234/test"}
-                        }
-                    ]
-                },
-                "test_repo.json",
-                True
-        ),
-    ])
+    @pytest.mark.parametrize("somef_data,file_name,expected_has_warning", _W006_CASES)
     def test_detect_warning_scenarios(self, somef_data, file_name, expected_has_warning):
         """Test various identifier name warning scenarios"""
         result = detect_identifier_name_warning(somef_data, file_name)
@@ -242,6 +233,16 @@ class TestDetectIdentifierNameWarning:
         assert "has_valid_identifier_elsewhere" in result
         assert "other_identifiers" in result
 
+    def test_empty_results_are_independent(self):
+        """Test that no-warning results never share state between calls"""
+        first = detect_identifier_name_warning({}, "a.json")
+        second = detect_identifier_name_warning({}, "b.json")
+
+        first["other_identifiers"].append("x")
+        assert first is not second
+        assert second["other_identifiers"] == []
+        assert second["file_name"] == "b.json"
+
     def test_codemeta_identifier_captured(self):
         """Test that codemeta identifier is properly captured"""
         somef_data = {
@@ -350,30 +351,34 @@ class TestDetectIdentifierNameWarning:
         result = detect_identifier_name_warning(somef_data, "test.json")
         assert result["has_warning"] == True
 
-    @pytest.mark.parametrize("valid_id", [
-        "10.1234/example",
-        "doi:10.5678/test",
-        "https://doi.org/10.1234/test",
-        "http://example.org/resource"
-    ])
-    def test_various_valid_identifier_formats(self, valid_id):
+    def test_various_valid_identifier_formats(self):
         """Test that various valid identifier formats trigger warning"""
-        somef_data = {
-            "identifier": [
-                {
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"value": "Project Name"}
-                },
-                {
-                    "source": "README.md",
-                    "result": {"value": valid_id}
-                }
-            ]
-        }
+        valid_ids = [
+            "10.1234/example",
+            "doi:10.5678/test",
+            "https://doi.org/10.1234/test",
+            "http://example.org/resource"
+        ]
+        assert all(is_valid_identifier(identifier) for identifier in valid_ids)
 
-        result = detect_identifier_name_warning(somef_data, "test.json")
-        assert result["has_warning"] == True
+        payloads = [
+            {
+                "identifier": [
+                    {
+                        "source": "repository/codemeta.json",
+                        "technique": "code_parser",
+                        "result": {"value": "Project Name"}
+                    },
+                    {
+                        "source": "README.md",
+                        "result": {"value": valid_id}
+                    }
+                ]
+            }
+            for valid_id in valid_ids
+        ]
+
+        assert all(detect_identifier_name_warning(payload, "test.json")["has_warning"] for payload in payloads)
 
     def test_no_warning_when_all_names(self):
         """Test no warning when all identifiers are names"""
@@ -2,236 +2,138 @@ import pytest
 from metacheck.scripts.warnings.w007 import detect_empty_identifier_warning
 
 
-class TestDetectEmptyIdentifierWarning:
-    """Test suite for detect_empty_identifier_warning function"""
-
-    @pytest.mark.parametrize(
-        "somef_data,file_name,expected_has_warning,expected_identifier,expected_source", [
-            # No identifier key
-            (
-                    {},
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Identifier not a list
-            (
-                    {"identifier": "some-id"},
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-            (
-                    {"identifier": {}},
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Empty identifier list
-            (
-                    {"identifier": []},
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Valid identifier from codemeta.json
-            (
+_W007_CASES = (
+    # Multiple entries, first valid, second empty
+    pytest.param(
+            {
+                "identifier": [
                     {
-                        "identifier": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": "my-project-id"}
-                        }]
+                        "source": "README.md",
+                        "technique": "header_analysis",
+                        "result": {"value": "valid-id"}
                     },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Empty string identifier from codemeta.json
-            (
-                    {
-                        "identifier": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": ""}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    "",
-                    "repository/codemeta.json"
-            ),
-
-            # Whitespace-only identifier
-            (
-                    {
-                        "identifier": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": "   "}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    "   ",
-                    "repository/codemeta.json"
-            ),
-
-            # None identifier
-            (
-                    {
-                        "identifier": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": None}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    None,
-                    "repository/codemeta.json"
-            ),
-
-            # Multiple entries, first valid, second empty
-            (
                     {
-                        "identifier": [
-                            {
-                                "source": "README.md",
-                                "technique": "header_analysis",
-                                "result": {"value": "valid-id"}
-                            },
-                            {
-                                "source": "repository/codemeta.json",
-                                "technique": "code_parser",
-                                "result": {"value": ""}
-                            }
-                        ]
-                    },
-                    "test_repo.json",
-                    True,
-                    "",
-                    "repository/codemeta.json"
-            ),
-
-            # codemeta in source (case-insensitive)
-            (
-                    {
-                        "identifier": [{
-                            "source": "repository/CodeMeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": ""}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    "",
-                    "repository/CodeMeta.json"
-            ),
-
-            # code_parser technique with codemeta mention
-            (
-                    {
-                        "identifier": [{
-                            "source": "codemeta file",
-                            "technique": "code_parser",
-                            "result": {"value": ""}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    "",
-                    "codemeta file"
-            ),
+                        "source": "repository/codemeta.json",
+                        "technique": "code_parser",
+                        "result": {"value": ""}
+                    }
+                ]
+            },
+            "test_repo.json",
+            True,
+            "",
+            "repository/codemeta.json",
+            id="first-valid-second-empty"
+    ),
 
-            # Non-codemeta source with empty identifier (should not trigger)
-            (
-                    {
-                        "identifier": [{
-                            "source": "README.md",
-                            "technique": "header_analysis",
-                            "result": {"value": ""}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
+    # Missing result key
+    pytest.param(
+            {
+                "identifier": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser"
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="missing-result"
+    ),
+
+    # Missing value in result
+    pytest.param(
+            {
+                "identifier": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser",
+                    "result": {}
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="missing-value"
+    ),
+)
+
+# Single codemeta-style entries:
+# (id, source, technique, value, expected_has_warning, expected_identifier, expected_source)
+_SINGLE_ENTRY_SPECS = (
+    ("valid-codemeta-id", "repository/codemeta.json", "code_parser", "my-project-id", False, None, None),
+    ("empty-string-codemeta", "repository/codemeta.json", "code_parser", "", True, "",
+     "repository/codemeta.json"),
+    ("whitespace-only", "repository/codemeta.json", "code_parser", "   ", True, "   ",
+     "repository/codemeta.json"),
+    ("none-value", "repository/codemeta.json", "code_parser", None, True, None, "repository/codemeta.json"),
+    ("case-insensitive-source", "repository/CodeMeta.json", "code_parser", "", True, "",
+     "repository/CodeMeta.json"),
+    ("code-parser-codemeta-mention", "codemeta file", "code_parser", "", True, "", "codemeta file"),
+    ("non-codemeta-source", "README.md", "header_analysis", "", False, None, None),
+    ("tab-newline", "repository/codemeta.json", "code_parser", "\t\n  ", True, "\t\n  ",
+     "repository/codemeta.json"),
+)
+
+
+@pytest.fixture
+def single_entry_data(request):
+    """Build the payload for a _SINGLE_ENTRY_SPECS row only when its test runs"""
+    _, source, technique, value = request.param[:4]
+    return {"identifier": [{"source": source, "technique": technique, "result": {"value": value}}]}
 
-            # Missing result key
-            (
-                    {
-                        "identifier": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser"
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
 
-            # Missing value in result
-            (
-                    {
-                        "identifier": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
+class TestDetectEmptyIdentifierWarning:
+    """Test suite for detect_empty_identifier_warning function"""
 
-            # Tab and newline characters (should be considered empty)
-            (
-                    {
-                        "identifier": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": "\t\n  "}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    "\t\n  ",
-                    "repository/codemeta.json"
-            ),
-        ])
+    @pytest.mark.parametrize(
+        "somef_data,file_name,expected_has_warning,expected_identifier,expected_source", _W007_CASES)
     def test_detect_empty_identifier_scenarios(self, somef_data, file_name,
                                                expected_has_warning, expected_identifier,
                                                expected_source):
         """Test various scenarios for empty identifier detection"""
         result = detect_empty_identifier_warning(somef_data, file_name)
 
-        assert result["has_warning"] == expected_has_warning
-        assert result["file_name"] == file_name
-        assert result["identifier_value"] == expected_identifier
-        assert result["source"] == expected_source
+        assert result == {
+            "has_warning": expected_has_warning,
+            "file_name": file_name,
+            "identifier_value": expected_identifier,
+            "source": expected_source
+        }
 
-    def test_result_structure(self):
-        """Test that result always has the expected structure"""
-        somef_data = {}
-        result = detect_empty_identifier_warning(somef_data, "test.json")
+    @pytest.mark.parametrize(
+        "single_entry_data,expected_has_warning,expected_identifier,expected_source",
+        [(spec, *spec[4:]) for spec in _SINGLE_ENTRY_SPECS],
+        indirect=["single_entry_data"], ids=[spec[0] for spec in _SINGLE_ENTRY_SPECS])
+    def test_single_entry_scenarios(self, single_entry_data, expected_has_warning,
+                                    expected_identifier, expected_source):
+        """Test empty identifier detection for single-entry payloads"""
+        result = detect_empty_identifier_warning(single_entry_data, "test_repo.json")
+
+        assert result == {
+            "has_warning": expected_has_warning,
+            "file_name": "test_repo.json",
+            "identifier_value": expected_identifier,
+            "source": expected_source
+        }
 
-        assert "has_warning" in result
-        assert "file_name" in result
-        assert "identifier_value" in result
-        assert "source" in result
+    @pytest.mark.parametrize("somef_data", [
+        {},
+        {"identifier": "some-id"},
+        {"identifier": {}},
+        {"identifier": []},
+    ], ids=["no-identifier-key", "identifier-str", "identifier-dict", "empty-list"])
+    def test_fast_path_no_warning(self, somef_data):
+        """Test that missing, non-list and empty identifiers return the untouched result"""
+        result = detect_empty_identifier_warning(somef_data, "test_repo.json")
+        assert result == {"has_warning": False, "file_name": "test_repo.json", "identifier_value": None, "source": None}
+
+    def test_result_structure(self, empty_w007_result):
+        """Test that result always has the expected structure"""
+        assert "has_warning" in empty_w007_result
+        assert "file_name" in empty_w007_result
+        assert "identifier_value" in empty_w007_result
+        assert "source" in empty_w007_result
 
     def test_stops_at_first_match(self):
         """Test that function returns after finding first empty identifier"""
@@ -257,7 +159,7 @@ class TestDetectEmptyIdentifierWarning:
 
     @pytest.mark.parametrize("technique", ["code_parser", "header_analysis", "github_api"])
     def test_technique_filtering(self, technique):
-        """Test that only code_parser technique triggers for codemeta"""
+        """Test that a codemeta.json source triggers regardless of technique"""
         somef_data = {
             "identifier": [{
                 "source": "repository/codemeta.json",
@@ -268,33 +170,28 @@ class TestDetectEmptyIdentifierWarning:
 
         result = detect_empty_identifier_warning(somef_data, "test.json")
 
-        if technique == "code_parser":
-            assert result["has_warning"] is True
-        else:
-            # For non-code_parser, it should still match if "codemeta.json" is in source
-            assert result["has_warning"] is True
+        # "codemeta.json" in the source matches on its own; technique only matters for other codemeta paths
+        assert result["has_warning"] is True
 
-    def test_source_variations(self):
+    @pytest.mark.parametrize("source", [
+        "codemeta.json",
+        "repository/codemeta.json",
+        "/path/to/codemeta.json",
+        "CODEMETA.json",
+        "project/CodeMeta.json"
+    ], ids=lambda s: s.replace("/", "_"))
+    def test_source_variations(self, source):
         """Test various source path formats"""
-        test_sources = [
-            "codemeta.json",
-            "repository/codemeta.json",
-            "/path/to/codemeta.json",
-            "CODEMETA.json",
-            "project/CodeMeta.json"
-        ]
-
-        for source in test_sources:
-            somef_data = {
-                "identifier": [{
-                    "source": source,
-                    "technique": "code_parser",
-                    "result": {"value": ""}
-                }]
-            }
+        somef_data = {
+            "identifier": [{
+                "source": source,
+                "technique": "code_parser",
+                "result": {"value": ""}
+            }]
+        }
 
-            result = detect_empty_identifier_warning(somef_data, "test.json")
-            assert result["has_warning"] is True, f"Failed for source: {source}"
+        result = detect_empty_identifier_warning(somef_data, "test.json")
+        assert result["has_warning"] is True, f"Failed for source: {source}"
 
     @pytest.mark.parametrize("empty_value", ["", "  ", "\t", "\n", "   \t\n  ", None])
     def test_various_empty_values(self, empty_value):
@@ -309,4 +206,7 @@ class TestDetectEmptyIdentifierWarning:
 
         result = detect_empty_identifier_warning(somef_data, "test.json")
         assert result["has_warning"] is True
-        assert result["identifier_value"] == empty_value
\ No newline at end of file
+        if empty_value is None:
+            assert result["identifier_value"] is None
+        else:
+            assert result["identifier_value"] == empty_value
\ No newline at end of file
@@ -1,287 +1,323 @@
+import re
 import pytest
-from unittest.mock import patch
+from types import MappingProxyType
+from metacheck.scripts.warnings import w008
 from metacheck.scripts.warnings.w008 import detect_author_name_list_warning
 
 
+_METADATA_FILES = (
+    "codemeta.json", "DESCRIPTION", "composer.json",
+    "package.json", "pom.xml", "pyproject.toml",
+    "requirements.txt", "setup.py"
+)
+
+_NO_COMMA_VALUES = (
+    "[SingleItem] Name",
+    "[] Name",
+    "[NoCommaHere] Name",
+    "['Single'] Name"
+)
+
+
+def _frozen_payload(source, value):
+    """Build a read-only single-author payload; the detector only reads its input"""
+    entry = MappingProxyType({"source": source, "technique": "code_parser", "result": MappingProxyType({"value": value})})
+    # authors stays a list because the detector ignores any other container type
+    return MappingProxyType({"authors": [entry]})
+
+
+_METADATA_PAYLOADS = {
+    metadata_file: _frozen_payload(f"repository/{metadata_file}", "['First', 'Second'] LastName")
+    for metadata_file in _METADATA_FILES
+}
+
+_NO_COMMA_PAYLOADS = {value: _frozen_payload("repository/codemeta.json", value) for value in _NO_COMMA_VALUES}
+
+
+_W008_CASES = (
+    # No authors key
+    pytest.param(
+            {},
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="no-authors-key"
+    ),
+
+    # Authors not a list
+    pytest.param(
+            {"authors": "John Doe"},
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="authors-str"
+    ),
+    pytest.param(
+            {"authors": {}},
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="authors-dict"
+    ),
+
+    # Empty authors list
+    pytest.param(
+            {"authors": []},
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="empty-list"
+    ),
+
+    # Valid author string without list pattern
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser",
+                    "result": {"value": "John Doe"}
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="plain-author"
+    ),
+
+    # Author with list pattern containing comma
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser",
+                    "result": {"value": "['William', 'Michael'] Landau"}
+                }]
+            },
+            "test_repo.json",
+            True,
+            "['William', 'Michael'] Landau",
+            "codemeta.json",
+            id="list-with-comma"
+    ),
+
+    # List pattern with single item (no comma, should not trigger)
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/package.json",
+                    "technique": "code_parser",
+                    "result": {"value": "['John'] Doe"}
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="single-item-list"
+    ),
+
+    # List pattern with multiple items and commas
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/setup.py",
+                    "technique": "code_parser",
+                    "result": {"value": "['Alice', 'Bob', 'Charlie'] Team"}
+                }]
+            },
+            "test_repo.json",
+            True,
+            "['Alice', 'Bob', 'Charlie'] Team",
+            "setup.py",
+            id="multi-item-list"
+    ),
+
+    # Non-string author value (should not trigger)
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser",
+                    "result": {"value": {"name": "John Doe"}}
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="non-string-value"
+    ),
+
+    # Author value as list (should not trigger since we check for string)
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/package.json",
+                    "technique": "code_parser",
+                    "result": {"value": ["John Doe", "Jane Smith"]}
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="list-value"
+    ),
+
+    # Non-metadata source (should not trigger)
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "README.md",
+                    "technique": "header_analysis",
+                    "result": {"value": "['William', 'Michael'] Landau"}
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="non-metadata-source"
+    ),
+
+    # Wrong technique (should not trigger)
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "github_api",
+                    "result": {"value": "['William', 'Michael'] Landau"}
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="wrong-technique"
+    ),
+
+    # Multiple list patterns in string
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/pyproject.toml",
+                    "technique": "code_parser",
+                    "result": {"value": "['First', 'Second'] ['Third', 'Fourth'] Name"}
+                }]
+            },
+            "test_repo.json",
+            True,
+            "['First', 'Second'] ['Third', 'Fourth'] Name",
+            "pyproject.toml",
+            id="multiple-lists"
+    ),
+
+    # Missing result key
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser"
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="missing-result"
+    ),
+
+    # Missing value in result
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser",
+                    "result": {}
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="missing-value"
+    ),
+
+    # Empty brackets (no comma, should not trigger)
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/composer.json",
+                    "technique": "code_parser",
+                    "result": {"value": "[] Author Name"}
+                }]
+            },
+            "test_repo.json",
+            False,
+            None,
+            None,
+            id="empty-brackets"
+    ),
+
+    # List with spaces around comma
+    pytest.param(
+            {
+                "authors": [{
+                    "source": "repository/pom.xml",
+                    "technique": "code_parser",
+                    "result": {"value": "['First' , 'Second'] LastName"}
+                }]
+            },
+            "test_repo.json",
+            True,
+            "['First' , 'Second'] LastName",
+            "pom.xml",
+            id="spaced-comma"
+    ),
+)
+
+
 class TestDetectAuthorNameListWarning:
     """Test suite for detect_author_name_list_warning function"""
 
     @pytest.mark.parametrize(
-        "somef_data,file_name,expected_has_warning,expected_author,expected_source_file", [
-            # No authors key
-            (
-                    {},
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Authors not a list
-            (
-                    {"authors": "John Doe"},
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-            (
-                    {"authors": {}},
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Empty authors list
-            (
-                    {"authors": []},
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Valid author string without list pattern
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": "John Doe"}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Author with list pattern containing comma
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": "['William', 'Michael'] Landau"}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    "['William', 'Michael'] Landau",
-                    "codemeta.json"
-            ),
-
-            # List pattern with single item (no comma, should not trigger)
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/package.json",
-                            "technique": "code_parser",
-                            "result": {"value": "['John'] Doe"}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # List pattern with multiple items and commas
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/setup.py",
-                            "technique": "code_parser",
-                            "result": {"value": "['Alice', 'Bob', 'Charlie'] Team"}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    "['Alice', 'Bob', 'Charlie'] Team",
-                    "setup.py"
-            ),
-
-            # Non-string author value (should not trigger)
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {"value": {"name": "John Doe"}}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Author value as list (should not trigger since we check for string)
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/package.json",
-                            "technique": "code_parser",
-                            "result": {"value": ["John Doe", "Jane Smith"]}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Non-metadata source (should not trigger)
-            (
-                    {
-                        "authors": [{
-                            "source": "README.md",
-                            "technique": "header_analysis",
-                            "result": {"value": "['William', 'Michael'] Landau"}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Wrong technique (should not trigger)
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "github_api",
-                            "result": {"value": "['William', 'Michael'] Landau"}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Multiple list patterns in string
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/pyproject.toml",
-                            "technique": "code_parser",
-                            "result": {"value": "['First', 'Second'] ['Third', 'Fourth'] Name"}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    "['First', 'Second'] ['Third', 'Fourth'] Name",
-                    "pyproject.toml"
-            ),
-
-            # Missing result key
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser"
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Missing value in result
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/codemeta.json",
-                            "technique": "code_parser",
-                            "result": {}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # Empty brackets (no comma, should not trigger)
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/composer.json",
-                            "technique": "code_parser",
-                            "result": {"value": "[] Author Name"}
-                        }]
-                    },
-                    "test_repo.json",
-                    False,
-                    None,
-                    None
-            ),
-
-            # List with spaces around comma
-            (
-                    {
-                        "authors": [{
-                            "source": "repository/pom.xml",
-                            "technique": "code_parser",
-                            "result": {"value": "['First' , 'Second'] LastName"}
-                        }]
-                    },
-                    "test_repo.json",
-                    True,
-                    "['First' , 'Second'] LastName",
-                    "pom.xml"
-            ),
-        ])
-    def test_detect_author_name_list_scenarios(self, somef_data, file_name,
+        "somef_data,file_name,expected_has_warning,expected_author,expected_source_file", _W008_CASES)
+    def test_detect_author_name_list_scenarios(self, pin_w008_metadata_file, somef_data, file_name,
                                                expected_has_warning, expected_author,
                                                expected_source_file):
         """Test various scenarios for author name list detection"""
-        with patch('metacheck.scripts.warnings.w008.extract_metadata_source_filename',
-                   return_value=expected_source_file):
-            result = detect_author_name_list_warning(somef_data, file_name)
-
-            assert result["has_warning"] == expected_has_warning
-            assert result["file_name"] == file_name
-            assert result["author_value"] == expected_author
-
-            if expected_has_warning:
-                assert result["metadata_source_file"] == expected_source_file
+        pin_w008_metadata_file(expected_source_file)
+        result = detect_author_name_list_warning(somef_data, file_name)
+
+        # No-warning rows expect a None source file, matching the untouched result
+        expected = {
+            "has_warning": expected_has_warning,
+            "file_name": file_name,
+            "author_value": expected_author,
+            "metadata_source_file": expected_source_file
+        }
+        assert {key: result[key] for key in expected} == expected
 
-    def test_result_structure(self):
+    def test_result_structure(self, empty_w008_result):
         """Test that result always has the expected structure"""
-        somef_data = {}
-        result = detect_author_name_list_warning(somef_data, "test.json")
-
-        assert "has_warning" in result
-        assert "file_name" in result
-        assert "author_value" in result
-        assert "source" in result
-        assert "metadata_source_file" in result
-
-    @pytest.mark.parametrize("metadata_file", [
-        "codemeta.json", "DESCRIPTION", "composer.json",
-        "package.json", "pom.xml", "pyproject.toml",
-        "requirements.txt", "setup.py"
-    ])
-    def test_all_metadata_sources(self, metadata_file):
+        assert "has_warning" in empty_w008_result
+        assert "file_name" in empty_w008_result
+        assert "author_value" in empty_w008_result
+        assert "source" in empty_w008_result
+        assert "metadata_source_file" in empty_w008_result
+
+    @pytest.mark.parametrize("metadata_file", _METADATA_FILES)
+    def test_all_metadata_sources(self, pin_w008_metadata_file, metadata_file):
         """Test that all metadata file types are correctly processed"""
-        somef_data = {
-            "authors": [{
-                "source": f"repository/{metadata_file}",
-                "technique": "code_parser",
-                "result": {"value": "['First', 'Second'] LastName"}
-            }]
-        }
-
-        with patch('metacheck.scripts.warnings.w008.extract_metadata_source_filename',
-                   return_value=metadata_file):
-            result = detect_author_name_list_warning(somef_data, "test.json")
-            assert result["has_warning"] is True
-            assert result["metadata_source_file"] == metadata_file
+        pin_w008_metadata_file(metadata_file)
+        result = detect_author_name_list_warning(_METADATA_PAYLOADS[metadata_file], "test.json")
+        assert result["has_warning"] is True
+        assert result["metadata_source_file"] == metadata_file
 
     @pytest.mark.parametrize("list_pattern", [
         "['A', 'B']",
@@ -290,7 +326,7 @@ class TestDetectAuthorNameListWarning:
         "['X' , 'Y' , 'Z']",  # Spaces around commas
         "[\"A\", \"B\"]",  # Double quotes
     ])
-    def test_various_list_patterns(self, list_pattern):
+    def test_various_list_patterns(self, pin_w008_metadata_file, list_pattern):
         """Test detection of various list pattern formats"""
         somef_data = {
             "authors": [{
@@ -300,33 +336,22 @@ class TestDetectAuthorNameListWarning:
             }]
         }
 
-        with patch('metacheck.scripts.warnings.w008.extract_metadata_source_filename',
-                   return_value="codemeta.json"):
-            result = detect_author_name_list_warning(somef_data, "test.json")
-            assert result["has_warning"] is True, f"Failed to detect pattern: {list_pattern}"
+        pin_w008_metadata_file("codemeta.json")
+        result = detect_author_name_list_warning(somef_data, "test.json")
+        assert result["has_warning"] is True, f"Failed to detect pattern: {list_pattern}"
 
-    def test_no_comma_in_brackets(self):
-        """Test that brackets without commas don't trigger warning"""
-        test_cases = [
-            "[SingleItem] Name",
-            "[] Name",
-            "[NoCommaHere] Name",
-            "['Single'] Name"
-        ]
-
-        for test_value in test_cases:
-            somef_data = {
-                "authors": [{
-                    "source": "repository/codemeta.json",
-                    "technique": "code_parser",
-                    "result": {"value": test_value}
-                }]
-            }
+    def test_list_pattern_is_precompiled(self):
+        """Test that the bracketed-list pattern is compiled once at import"""
+        assert isinstance(w008._LIST_PAT, re.Pattern)
+        assert w008._LIST_PAT.findall("['A', 'B'] [C] Name") == ["'A', 'B'", "C"]
 
-            result = detect_author_name_list_warning(somef_data, "test.json")
-            assert result["has_warning"] is False, f"False positive for: {test_value}"
+    @pytest.mark.parametrize("test_value", _NO_COMMA_VALUES)
+    def test_no_comma_in_brackets(self, test_value):
+        """Test that brackets without commas don't trigger warning"""
+        result = detect_author_name_list_warning(_NO_COMMA_PAYLOADS[test_value], "test.json")
+        assert result["has_warning"] is False, f"False positive for: {test_value}"
 
-    def test_multiple_authors_first_has_warning(self):
+    def test_multiple_authors_first_has_warning(self, pin_w008_metadata_file):
         """Test processing multiple author entries where first has warning"""
         somef_data = {
             "authors": [
@@ -343,40 +368,29 @@ class TestDetectAuthorNameListWarning:
             ]
         }
 
-        with patch('metacheck.scripts.warnings.w008.extract_metadata_source_filename',
-                   return_value="codemeta.json"):
-            result = detect_author_name_list_warning(somef_data, "test.json")
-            assert result["has_warning"] is True
-
-    def test_source_field_variations(self):
+        pin_w008_metadata_file("codemeta.json")
+        result = detect_author_name_list_warning(somef_data, "test.json")
+        assert result["has_warning"] is True
+
+    @pytest.mark.parametrize("source,expected_has_warning", [
+        pytest.param("codemeta.json", True, id="bare-codemeta"),
+        pytest.param("repository/codemeta.json", True, id="repository-codemeta"),
+        pytest.param("/full/path/to/package.json", True, id="full-path-package"),
+        pytest.param("setup.py", True, id="bare-setup-py"),
+        pytest.param("DESCRIPTION", True, id="bare-description"),
+        pytest.param("repository/CodeMeta.JSON", False, id="mixed-case-codemeta"),
+        pytest.param("README.md", False, id="readme"),
+    ])
+    def test_source_field_variations(self, pin_w008_metadata_file, source, expected_has_warning):
         """Test various source field formats"""
-        test_sources = [
-            "codemeta.json",
-            "repository/codemeta.json",
-            "/full/path/to/package.json",
-            "setup.py",
-            "DESCRIPTION"
-        ]
-
-        for source in test_sources:
-            expected_file = source.split('/')[-1]
-            somef_data = {
-                "authors": [{
-                    "source": source,
-                    "technique": "code_parser",
-                    "result": {"value": "['A', 'B'] Name"}
-                }]
-            }
-
-            with patch('metacheck.scripts.warnings.w008.extract_metadata_source_filename',
-                       return_value=expected_file):
-                result = detect_author_name_list_warning(somef_data, "test.json")
-
-                # Check if it's a metadata source
-                is_metadata = any(meta in source for meta in [
-                    "codemeta.json", "DESCRIPTION", "composer.json",
-                    "package.json", "pom.xml", "pyproject.toml",
-                    "requirements.txt", "setup.py"
-                ])
+        somef_data = {
+            "authors": [{
+                "source": source,
+                "technique": "code_parser",
+                "result": {"value": "['A', 'B'] Name"}
+            }]
+        }
 
-                assert result["has_warning"] == is_metadata
\ No newline at end of file
+        pin_w008_metadata_file(source.split('/')[-1])
+        result = detect_author_name_list_warning(somef_data, "test.json")
+        assert result["has_warning"] == expected_has_warning
\ No newline at end of file
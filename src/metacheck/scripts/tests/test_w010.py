@@ -6,62 +6,64 @@ from metacheck.scripts.warnings.w010 import (
 )
 
 
+_SHORTHAND_CASES = (
+    # Valid Git remote shorthand patterns
+    ("github.com:user/repo.git", True),
+    ("github.com:user/repo", True),
+    ("gitlab.com:group/project.git", True),
+    ("bitbucket.org:team/repository", True),
+    ("git.example.com:user/project.git", True),
+    ("server.com:path/to/repo", True),
+
+    # With hyphens and dots in hostname
+    ("git-server.com:user/repo.git", True),
+    ("my.git.server.com:project.git", True),
+
+    # With underscores and dots in path
+    ("github.com:user/my_repo.git", True),
+    ("github.com:org/repo.name.git", True),
+    ("github.com:user/repo-name", True),
+
+    # Full HTTP/HTTPS URLs (should return False)
+    ("https://github.com/user/repo.git", False),
+    ("http://gitlab.com/user/project.git", False),
+    ("https://github.com/user/repo", False),
+
+    # Invalid patterns
+    ("not-a-url", False),
+    ("just-text", False),
+    ("user@host:repo", False),  # SSH format but with @
+    ("github.com/user/repo", False),  # Missing colon
+    (":invalid", False),
+    ("github.com:", False),
+
+    # Empty or None
+    ("", False),
+    ("   ", False),
+    (None, False),
+
+    # Edge cases
+    ("a:b", True),  # Minimal valid pattern
+    ("host.com:path", True),
+    ("HOST.COM:PATH.GIT", True),  # Uppercase
+
+    # With numbers
+    ("git123.com:user/repo123.git", True),
+    ("github.com:user123/repo456", True),
+
+    # Multiple levels in path
+    ("github.com:org/team/project.git", True),
+    ("gitlab.com:group/subgroup/repo", True),
+)
+
+
 class TestIsGitRemoteShorthand:
     """Test suite for is_git_remote_shorthand helper function"""
 
-    @pytest.mark.parametrize("url,expected", [
-        # Valid Git remote shorthand patterns
-        ("github.com:user/repo.git", True),
-        ("github.com:user/repo", True),
-        ("gitlab.com:group/project.git", True),
-        ("bitbucket.org:team/repository", True),
-        ("git.example.com:user/project.git", True),
-        ("server.com:path/to/repo", True),
-
-        # With hyphens and dots in hostname
-        ("git-server.com:user/repo.git", True),
-        ("my.git.server.com:project.git", True),
-
-        # With underscores and dots in path
-        ("github.com:user/my_repo.git", True),
-        ("github.com:org/repo.name.git", True),
-        ("github.com:user/repo-name", True),
-
-        # Full HTTP/HTTPS URLs (should return False)
-        ("https://github.com/user/repo.git", False),
-        ("http://gitlab.com/user/project.git", False),
-        ("https://github.com/user/repo", False),
-
-        # Invalid patterns
-        ("not-a-url", False),
-        ("just-text", False),
-        ("user@host:repo", False),  # SSH format but with @
-        ("github.com/user/repo", False),  # Missing colon
-        (":invalid", False),
-        ("github.com:", False),
-
-        # Empty or None
-        ("", False),
-        ("   ", False),
-        (None, False),
-
-        # Edge cases
-        ("a:b", True),  # Minimal valid pattern
-        ("host.com:path", True),
-        ("HOST.COM:PATH.GIT", True),  # Uppercase
-
-        # With numbers
-        ("git123.com:user/repo123.git", True),
-        ("github.com:user123/repo456", True),
-
-        # Multiple levels in path
-        ("github.com:org/team/project.git", True),
-        ("gitlab.com:group/subgroup/repo", True),
-    ])
-    def test_is_git_remote_shorthand_scenarios(self, url, expected):
+    def test_is_git_remote_shorthand_scenarios(self):
         """Test various Git remote shorthand detection scenarios"""
-        result = is_git_remote_shorthand(url)
-        assert result == expected, f"Failed for URL: {url}"
+        for url, expected in _SHORTHAND_CASES:
+            assert is_git_remote_shorthand(url) == expected, url
 
     def test_is_git_remote_shorthand_with_non_string(self):
         """Test is_git_remote_shorthand with non-string inputs"""
@@ -377,6 +379,22 @@ class TestDetectGitRemoteShorthandPitfall:
             assert result["has_pitfall"] is True
             assert result["metadata_source_file"] == metadata_file
 
+    def test_description_source_without_code_parser(self):
+        """Test that a DESCRIPTION source is matched even when the technique is not code_parser"""
+        somef_data = {
+            "code_repository": [{
+                "technique": "file_exploration",
+                "source": "repository/DESCRIPTION",
+                "result": {"value": "github.com:user/repo.git"}
+            }]
+        }
+
+        with patch('metacheck.scripts.warnings.w010.extract_metadata_source_filename',
+                   return_value="DESCRIPTION"):
+            result = detect_git_remote_shorthand_pitfall(somef_data, "test.json")
+            assert result["has_pitfall"] is True
+            assert result["source"] == "repository/DESCRIPTION"
+
     def test_stops_at_first_match(self):
         """Test that function returns after finding first shorthand"""
         somef_data = {
@@ -1,6 +1,11 @@
 from typing import Dict, List
 import re
-from metacheck.utils.pitfall_utils import extract_metadata_source_filename
+from metacheck.utils.pitfall_utils import extract_entry_triples, extract_metadata_source_filename
+
+# Separators that indicate several requirements were written as one string
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')  # Multiple spaces
+_CAPITALIZED_WORD_RE = re.compile(r'\s+[A-Z][A-Za-z]')  # Space followed by a capitalized word
+_CAPITAL_SPLIT_RE = re.compile(r'\s+(?=[A-Z])')  # Split point before a new requirement
 
 
 def detect_multiple_requirements_in_string(requirement_string: str) -> List[str]:
@@ -14,25 +19,19 @@ def detect_multiple_requirements_in_string(requirement_string: str) -> List[str]
     # Clean the string
     req_str = requirement_string.strip()
 
-    # Patterns that might indicate multiple requirements
-    # Split by common separators but be careful not to split version specifiers
-    potential_separators = [
-        r'\s{2,}',  # Multiple spaces
-        r'\s+(?=[A-Za-z])',  # Space followed by letter (new requirement)
-        r',\s*',  # Comma separation
-        r';\s*',  # Semicolon separation
-    ]
+    # Both separators need whitespace, so a single token can be rejected before any regex runs
+    if len(req_str.split(None, 1)) < 2:
+        return []
 
     detected_requirements = []
 
-    if re.search(r'\s{2,}', req_str):
-        parts = re.split(r'\s{2,}', req_str)
-        if len(parts) > 1:
-            detected_requirements = [part.strip() for part in parts if part.strip()]
+    parts = _MULTI_SPACE_RE.split(req_str)
+    if len(parts) > 1:
+        detected_requirements = [part.strip() for part in parts if part.strip()]
 
     if not detected_requirements:
-        if re.search(r'\s+[A-Z][A-Za-z]', req_str):
-            parts = re.split(r'\s+(?=[A-Z])', req_str)
+        if _CAPITALIZED_WORD_RE.search(req_str):
+            parts = _CAPITAL_SPLIT_RE.split(req_str)
             if len(parts) > 1:
                 detected_requirements = [part.strip() for part in parts if part.strip()]
 
@@ -62,39 +61,33 @@ def detect_multiple_requirements_string_warning(somef_data: Dict, file_name: str
 
     metadata_sources = ["codemeta.json", "DESCRIPTION", "composer.json", "package.json", "pom.xml", "pyproject.toml", "requirements.txt", "setup.py"]
 
-    for entry in requirements_entries:
-        technique = entry.get("technique", "")
-        source = entry.get("source", "")
-
+    for source, technique, requirement_value in extract_entry_triples(requirements_entries):
         if technique in metadata_sources or any(
                 src in source.lower() for src in ["codemeta.json", "setup.py", "pom.xml"]):
-            if "result" in entry and "value" in entry["result"]:
-                requirement_value = entry["result"]["value"]
-
-                if isinstance(requirement_value, str):
-                    detected_reqs = detect_multiple_requirements_in_string(requirement_value)
+            if isinstance(requirement_value, str):
+                detected_reqs = detect_multiple_requirements_in_string(requirement_value)
+
+                if detected_reqs:
+                    result["has_warning"] = True
+                    result["requirement_string"] = requirement_value
+                    result["detected_requirements"] = detected_reqs
+                    result["source"] = source if source else f"technique: {technique}"
+                    result["metadata_source_file"] = extract_metadata_source_filename(source)
+                    result["count_detected"] = len(detected_reqs)
+                    break
+
+            elif isinstance(requirement_value, list) and len(requirement_value) == 1:
+                single_req = requirement_value[0]
+                if isinstance(single_req, str):
+                    detected_reqs = detect_multiple_requirements_in_string(single_req)
 
                     if detected_reqs:
                         result["has_warning"] = True
-                        result["requirement_string"] = requirement_value
+                        result["requirement_string"] = single_req
                         result["detected_requirements"] = detected_reqs
                         result["source"] = source if source else f"technique: {technique}"
                         result["metadata_source_file"] = extract_metadata_source_filename(source)
                         result["count_detected"] = len(detected_reqs)
                         break
 
-                elif isinstance(requirement_value, list) and len(requirement_value) == 1:
-                    single_req = requirement_value[0]
-                    if isinstance(single_req, str):
-                        detected_reqs = detect_multiple_requirements_in_string(single_req)
-
-                        if detected_reqs:
-                            result["has_warning"] = True
-                            result["requirement_string"] = single_req
-                            result["detected_requirements"] = detected_reqs
-                            result["source"] = source if source else f"technique: {technique}"
-                            result["metadata_source_file"] = extract_metadata_source_filename(source)
-                            result["count_detected"] = len(detected_reqs)
-                            break
-
     return result
\ No newline at end of file
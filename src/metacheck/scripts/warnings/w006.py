@@ -1,5 +1,18 @@
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterator, List
 import re
+from metacheck.utils.pitfall_utils import extract_entry_triples
+
+# doi:10.xxxx/yyyy or bare 10.xxxx/yyyy DOI. Patterns are only used with match(), so a single
+# character after the prefix is enough and the rest of the value is never scanned
+_DOI_PATTERN = r'(?:doi:)?10\.\d+/.'
+_DOI_RE = re.compile('^' + _DOI_PATTERN, re.IGNORECASE)
+# DOI or HTTP/HTTPS URL
+_VALID_ID_RE = re.compile(r'^(?:' + _DOI_PATTERN + r'|https?://.)', re.IGNORECASE)
+# Incomplete DOI prefix on its own, or an FTP URL
+_REJECTED_ID_RE = re.compile(r'(?:doi:|10\.)\Z|ftp://', re.IGNORECASE)
+# Separators dropped before checking whether an identifier is only letters, i.e. a name
+_NAME_SEPARATORS = str.maketrans('', '', ' -_')
 
 
 def is_valid_identifier(identifier: str) -> bool:
@@ -9,65 +22,51 @@ def is_valid_identifier(identifier: str) -> bool:
     if not identifier or not isinstance(identifier, str):
         return False
 
-    identifier = identifier.strip()
+    return _is_valid_identifier_cached(identifier)
 
-    if not identifier:
-        return False
 
-    # Check for DOI patterns
-    doi_patterns = [
-        r'^doi:10\.\d+/.+',  # doi:10.xxxx/yyyy format
-        r'^10\.\d+/.+'  # 10.xxxx/yyyy format (bare DOI)
-    ]
-
-    for pattern in doi_patterns:
-        if re.match(pattern, identifier, re.IGNORECASE):
-            return True
+@lru_cache(maxsize=1024)
+def _is_valid_identifier_cached(identifier: str) -> bool:
+    """
+    Identifier check for non-empty strings; the same identifiers recur across entries and files.
+    """
+    identifier = identifier.strip()
 
-    if identifier.lower() in ['doi:', '10.']:
+    if not identifier:
         return False
 
-    url_pattern = r'^https?://.+'
-    if re.match(url_pattern, identifier, re.IGNORECASE):
+    if _VALID_ID_RE.match(identifier):
         return True
 
-    if identifier.lower().startswith('ftp://'):
+    if _REJECTED_ID_RE.match(identifier):
         return False
 
     if ' ' in identifier and not any(char in identifier for char in ['/', ':', '.']):
         return False
 
-    if identifier.replace(' ', '').replace('-', '').replace('_', '').isalpha():
+    if identifier.translate(_NAME_SEPARATORS).isalpha():
         return False
 
     return True
 
 
-def has_doi_in_other_sources(identifier_entries: List[Dict]) -> bool:
+def _iter_other_values(identifier_entries: List[Dict]) -> Iterator[str]:
     """
-    Check if there's a valid DOI in non-codemeta sources.
+    Yield the string values of identifier entries whose source is not codemeta.json.
     """
-    for entry in identifier_entries:
-        source = entry.get("source", "")
-
+    for source, _, identifier_value in extract_entry_triples(identifier_entries):
         if "codemeta.json" in source.lower():
             continue
 
-        if "result" in entry and "value" in entry["result"]:
-            identifier_value = entry["result"]["value"]
-
-            if isinstance(identifier_value, str):
-                # Check for DOI patterns
-                doi_patterns = [
-                    r'^doi:10\.\d+/.+',  # doi:10.xxxx/yyyy format
-                    r'^10\.\d+/.+'  # 10.xxxx/yyyy format (bare DOI)
-                ]
+        if isinstance(identifier_value, str):
+            yield identifier_value
 
-                for pattern in doi_patterns:
-                    if re.match(pattern, identifier_value, re.IGNORECASE):
-                        return True
 
-    return False
+def has_doi_in_other_sources(identifier_entries: List[Dict]) -> bool:
+    """
+    Check if there's a valid DOI in non-codemeta sources.
+    """
+    return any(_DOI_RE.match(value) for value in _iter_other_values(identifier_entries))
 
 
 def detect_identifier_name_warning(somef_data: Dict, file_name: str) -> Dict:
@@ -99,46 +98,29 @@ def detect_identifier_name_warning(somef_data: Dict, file_name: str) -> Dict:
     other_source = None
     other_identifiers = []
 
-    for entry in identifier_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        is_codemeta = (
-                "codemeta.json" in source.lower() or
-                (technique == "code_parser" and "codemeta" in source.lower())
-        )
-
-        if is_codemeta:
-            if "result" in entry and "value" in entry["result"]:
-                if codemeta_identifier is None:  # Use first one found
-                    codemeta_identifier = entry["result"]["value"]
-                    codemeta_source = source
-                    break  # Stop at first codemeta identifier
-
-    for entry in identifier_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
+    for source, technique, identifier_value in extract_entry_triples(identifier_entries):
+        source_lower = source.lower()
         is_codemeta = (
-                "codemeta.json" in source.lower() or
-                (technique == "code_parser" and "codemeta" in source.lower())
+                "codemeta.json" in source_lower or
+                (technique == "code_parser" and "codemeta" in source_lower)
         )
 
         if is_codemeta:
+            # Use the first codemeta entry found; a codemeta source is never empty, so it marks the hit
+            if codemeta_source is None:
+                codemeta_identifier = identifier_value
+                codemeta_source = source
             continue
 
-        if "result" in entry and "value" in entry["result"]:
-            identifier_value = entry["result"]["value"]
-
-            if is_valid_identifier(identifier_value):
-                other_identifiers.append({
-                    "value": identifier_value,
-                    "source": source
-                })
+        if is_valid_identifier(identifier_value):
+            other_identifiers.append({
+                "value": identifier_value,
+                "source": source
+            })
 
-                if other_identifier is None:
-                    other_identifier = identifier_value
-                    other_source = source
+            if other_identifier is None:
+                other_identifier = identifier_value
+                other_source = source
 
     result["codemeta_identifier"] = codemeta_identifier
     result["codemeta_source"] = codemeta_source
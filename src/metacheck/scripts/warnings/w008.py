@@ -2,6 +2,13 @@ from typing import Dict
 import re
 from metacheck.utils.pitfall_utils import extract_metadata_source_filename
 
+# Contents of each bracketed group, e.g. "'William', 'Michael'" in "['William', 'Michael'] Landau"
+_LIST_PAT = re.compile(r"\[(.*?)\]")
+
+# Metadata files whose author fields are checked; matched as substrings of the entry source
+METADATA_FILES = frozenset({"codemeta.json", "DESCRIPTION", "composer.json", "package.json", "pom.xml",
+                            "pyproject.toml", "requirements.txt", "setup.py"})
+
 
 def detect_author_name_list_warning(somef_data: Dict, file_name: str) -> Dict:
     """
@@ -22,16 +29,13 @@ def detect_author_name_list_warning(somef_data: Dict, file_name: str) -> Dict:
     if not isinstance(authors_entries, list):
         return result
 
-    metadata_sources = ["codemeta.json", "DESCRIPTION", "composer.json", "package.json", "pom.xml", "pyproject.toml",
-                        "requirements.txt", "setup.py"]
-
     for entry in authors_entries:
         source = entry.get("source", "")
         technique = entry.get("technique", "")
 
         is_metadata_source = (
                 technique == "code_parser" and
-                any(src in source for src in metadata_sources)
+                any(src in source for src in METADATA_FILES)
         )
 
         if is_metadata_source:
@@ -40,16 +44,12 @@ def detect_author_name_list_warning(somef_data: Dict, file_name: str) -> Dict:
 
                 if isinstance(author_value, str):
                     # Look for patterns like "['William', 'Michael'] Landau" or similar list structures
-                    list_pattern = r"\[.*?\]"
-                    if re.search(list_pattern, author_value):
-                        list_content = re.findall(r"\[(.*?)\]", author_value)
-                        if list_content:
-                            for content in list_content:
-                                if "," in content and len(content.split(",")) > 1:
-                                    result["has_warning"] = True
-                                    result["author_value"] = author_value
-                                    result["source"] = source
-                                    result["metadata_source_file"] = extract_metadata_source_filename(source)
-                                    break
+                    for content in _LIST_PAT.findall(author_value):
+                        if "," in content:
+                            result["has_warning"] = True
+                            result["author_value"] = author_value
+                            result["source"] = source
+                            result["metadata_source_file"] = extract_metadata_source_filename(source)
+                            break
 
     return result
\ No newline at end of file
@@ -1,6 +1,16 @@
-from typing import Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 import re
 
+# HTTP/HTTPS or www-prefixed URLs, or any value containing a .org/.com/.net domain
+_URL_PREFIXES = ("http://", "https://", "www.")
+_URL_DOMAINS = (".org", ".com", ".net")
+# repostatus.org status names, the most common plain (non-URL) developmentStatus values
+_KNOWN_STATUSES = frozenset({"active", "inactive", "wip", "concept", "suspended", "unsupported", "moved",
+                             "alpha", "beta", "stable"})
+# Case-insensitive "codemeta" lookup without building a lowercased copy of the source
+_CODEMETA_RE = re.compile(r'codemeta', re.IGNORECASE)
+
 
 def is_url(value: str) -> bool:
     """
@@ -9,21 +19,34 @@ def is_url(value: str) -> bool:
     if not value or not isinstance(value, str):
         return False
 
-    url_patterns = [
-        r'^https?://',  # HTTP/HTTPS URLs
-        r'^www\.',  # URLs starting with www
-        r'\.org',  # Contains .org
-        r'\.com',  # Contains .com
-        r'\.net',  # Contains .net
-    ]
+    return _is_url_cached(value)
+
 
+@lru_cache(maxsize=1024)
+def _is_url_cached(value: str) -> bool:
+    """
+    URL check for non-empty strings; status values repeat heavily across repositories.
+    """
     value_lower = value.lower().strip()
+    if value_lower in _KNOWN_STATUSES:
+        return False
+    return value_lower.startswith(_URL_PREFIXES) or any(domain in value_lower for domain in _URL_DOMAINS)
+
 
-    for pattern in url_patterns:
-        if re.search(pattern, value_lower):
-            return True
+def _codemeta_value(entry: Dict) -> Optional[Tuple[str, Any]]:
+    """
+    Return (source, value) for a development_status entry from codemeta.json, or None for any other entry.
+    """
+    source = entry.get("source", "")
+
+    # The technique and the case-insensitive search are only needed when the exact filename is absent
+    if "codemeta.json" not in source and (entry.get("technique") != "code_parser" or not _CODEMETA_RE.search(source)):
+        return None
 
-    return False
+    entry_result = entry.get("result")
+    if entry_result is None or "value" not in entry_result:
+        return None
+    return source, entry_result["value"]
 
 
 def detect_development_status_url_pitfall(somef_data: Dict, file_name: str) -> Dict:
@@ -38,26 +61,19 @@ def detect_development_status_url_pitfall(somef_data: Dict, file_name: str) -> D
         "is_url": False
     }
 
-    if "development_status" not in somef_data:
+    dev_status_entries = somef_data.get("development_status")
+    if not dev_status_entries or not isinstance(dev_status_entries, list):
         return result
 
-    dev_status_entries = somef_data["development_status"]
-    if not isinstance(dev_status_entries, list):
-        return result
-
-    for entry in dev_status_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        if "codemeta.json" in source or (technique == "code_parser" and "codemeta" in source.lower()):
-            if "result" in entry and "value" in entry["result"]:
-                dev_status = entry["result"]["value"]
+    # First codemeta entry whose value is a URL; the generator stops scanning at the match
+    match = next(
+        (found for found in map(_codemeta_value, dev_status_entries) if found is not None and is_url(found[1])),
+        None
+    )
 
-                if is_url(dev_status):
-                    result["has_pitfall"] = True
-                    result["development_status"] = dev_status
-                    result["source"] = source
-                    result["is_url"] = True
-                    break
+    if match is not None:
+        result["has_pitfall"] = True
+        result["source"], result["development_status"] = match
+        result["is_url"] = True
 
     return result
\ No newline at end of file
@@ -2,6 +2,13 @@ from typing import Dict
 import re
 from metacheck.utils.pitfall_utils import extract_metadata_source_filename
 
+# host:path remote shorthand such as github.com:user/repo or github.com:user/repo.git
+_SHORTHAND_RE = re.compile(r'^[a-zA-Z0-9.-]+:[a-zA-Z0-9._/-]+$')
+# Metadata files that may declare codeRepository, lowercased to match the lowercased entry source
+_METADATA_FILES = ("codemeta.json", "description", "composer.json", "package.json", "pom.xml",
+                   "pyproject.toml", "requirements.txt", "setup.py")
+
+
 def is_git_remote_shorthand(url: str) -> bool:
     """
     Check if URL uses Git remote-style shorthand instead of full URL.
@@ -9,22 +16,13 @@ def is_git_remote_shorthand(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
 
-    # Git remote shorthand patterns
-    shorthand_patterns = [
-        r'^[a-zA-Z0-9.-]+:[a-zA-Z0-9._/-]+\.git$',  # github.com:user/repo.git
-        r'^[a-zA-Z0-9.-]+:[a-zA-Z0-9._/-]+$',  # github.com:user/repo
-    ]
-
     url = url.strip()
 
-    if url.startswith(('http://', 'https://')):
+    # Values without a colon, and full http(s) URLs, are rejected before reaching the regex engine
+    if ':' not in url or url.startswith(('http://', 'https://')):
         return False
 
-    for pattern in shorthand_patterns:
-        if re.match(pattern, url):
-            return True
-
-    return False
+    return _SHORTHAND_RE.match(url) is not None
 
 
 def detect_git_remote_shorthand_pitfall(somef_data: Dict, file_name: str) -> Dict:
@@ -47,28 +45,25 @@ def detect_git_remote_shorthand_pitfall(somef_data: Dict, file_name: str) -> Dic
     if not isinstance(repo_entries, list):
         return result
 
-    metadata_techniques = ["code_parser"]
-    metadata_sources = ["codemeta.json", "DESCRIPTION", "composer.json", "package.json", "pom.xml", "pyproject.toml", "requirements.txt", "setup.py"]
-
     for entry in repo_entries:
         technique = entry.get("technique", "")
         source = entry.get("source", "")
 
         is_metadata_source = (
-                technique in metadata_techniques or
-                any(src in source.lower() for src in metadata_sources)
+                technique == "code_parser" or
+                any(src in source.lower() for src in _METADATA_FILES)
         )
 
         if is_metadata_source:
-            if "result" in entry and "value" in entry["result"]:
-                repo_url = entry["result"]["value"]
-
-                if is_git_remote_shorthand(repo_url):
-                    result["has_pitfall"] = True
-                    result["repository_url"] = repo_url
-                    result["source"] = source if source else f"technique: {technique}"
-                    result["metadata_source_file"] = extract_metadata_source_filename(source)
-                    result["is_shorthand"] = True
-                    break
+            # A missing result or value yields None, which is_git_remote_shorthand rejects
+            repo_url = (entry.get("result") or {}).get("value")
+
+            if is_git_remote_shorthand(repo_url):
+                result["has_pitfall"] = True
+                result["repository_url"] = repo_url
+                result["source"] = source if source else f"technique: {technique}"
+                result["metadata_source_file"] = extract_metadata_source_filename(source)
+                result["is_shorthand"] = True
+                break
 
     return result
\ No newline at end of file
@@ -1,6 +1,6 @@
 import re
 import os
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 
 def extract_programming_languages(somef_data: Dict) -> List[str]:
@@ -92,4 +92,21 @@ def extract_metadata_source_filename(source_path: str) -> str:
     if not filename:
         return "metadata files"
         
-    return filename
\ No newline at end of file
+    return filename
+
+
+def extract_entry_triples(entries: List[Dict]) -> Iterator[Tuple[str, str, Any]]:
+    """
+    Walk SoMEF entries once, yielding the fields detectors inspect.
+    Entries with a missing or None result, or without a value, are skipped.
+
+    Args:
+        entries: The list of SoMEF entries for a single metadata property
+
+    Returns:
+        An iterator of (source, technique, value) tuples
+    """
+    for entry in entries:
+        result = entry.get("result") or {}
+        if "value" in result:
+            yield entry.get("source", ""), entry.get("technique", ""), result["value"]